@@ -14,7 +14,8 @@ setup(
         "python-jose[cryptography]==3.3.0",
         "python-multipart==0.0.5",
         "aiosqlite==0.17.0",
-        "tortoise-orm==0.19.2"
+        "tortoise-orm==0.19.2",
+        "orjson>=3.8.0"
     ],
     python_requires=">=3.11",
 ) 
\ No newline at end of file
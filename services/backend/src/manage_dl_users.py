@@ -4,7 +4,7 @@ from user_actions.invite_user import invite_user, list_pending_invites
 from user_actions.manage_roles import assign_role
 from user_actions.service_users import create_service_user, list_service_users
 from user_actions.container_access import list_available_containers, assign_self_to_container
-from user_actions.base_client import DeepLynxClient
+from user_actions.base_client import DeepLynxClient, get_default_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -77,8 +77,8 @@ def display_container_menu(client: DeepLynxClient):
             logger.error(f"Operation failed: {str(e)}")
 
 def main():
-    # Create a shared client instance
-    client = DeepLynxClient()
+    # Use the shared client instance
+    client = get_default_client()
     
     while True:
         print("\nDeep Lynx User Management")
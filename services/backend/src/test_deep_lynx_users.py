@@ -1,16 +1,24 @@
 import deep_lynx
 from deep_lynx.rest import ApiException
+import base64
 import os
 from dotenv import load_dotenv
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Concurrent role lookups; the connection pool is sized to match
+MAX_WORKERS = 16
+
 class DeepLynxUserTester:
+    __slots__ = (
+        'host', 'api_key', 'api_secret', 'container_id',
+        'configuration', 'api_client', 'users_api', 'auth_api'
+    )
+
     def __init__(self, host: str = None, env_file_path: str = None):
         """Initialize the Deep Lynx User Tester"""
         try:
@@ -28,29 +36,29 @@ class DeepLynxUserTester:
 
             # Debug logging
             logger.debug("=== Deep Lynx User Tester Configuration ===")
-            logger.debug(f"Host: {self.host}")
-            logger.debug(f"Container ID: {self.container_id}")
-            logger.debug(f"API Key present: {'Yes' if self.api_key else 'No'}")
-            logger.debug(f"API Secret present: {'Yes' if self.api_secret else 'No'}")
+            logger.debug("Host: %s", self.host)
+            logger.debug("Container ID: %s", self.container_id)
+            logger.debug("API Key present: %s", 'Yes' if self.api_key else 'No')
+            logger.debug("API Secret present: %s", 'Yes' if self.api_secret else 'No')
 
             # Configure Deep Lynx client
             self.configuration = deep_lynx.Configuration()
             self.configuration.host = self.host
-            
-            # Set up authentication
-            auth_str = f"{self.api_key}:{self.api_secret}"
-            self.configuration.api_key['Authorization'] = auth_str
-            self.configuration.api_key_prefix['Authorization'] = 'Basic'
+            self.configuration.connection_pool_maxsize = MAX_WORKERS
             
             # Create API client
             self.api_client = deep_lynx.ApiClient(self.configuration)
             
+            # Set up authentication, encoded once for every request
+            auth_str = base64.b64encode(f"{self.api_key}:{self.api_secret}".encode()).decode()
+            self.api_client.default_headers['Authorization'] = f"Basic {auth_str}"
+            
             # Initialize Users API
             self.users_api = deep_lynx.UsersApi(self.api_client)
             self.auth_api = deep_lynx.AuthenticationApi(self.api_client)
 
         except Exception as e:
-            logger.error(f"Failed to initialize Deep Lynx User Tester: {str(e)}")
+            logger.error("Failed to initialize Deep Lynx User Tester: %s", e)
             logger.debug("Error details:", exc_info=True)
             raise
 
@@ -68,7 +76,7 @@ class DeepLynxUserTester:
             elif hasattr(token_response, 'value'):
                 token = token_response.value
             else:
-                logger.error(f"Unexpected token response type: {type(token_response)}")
+                logger.error("Unexpected token response type: %s", type(token_response))
                 return False
             
             self.api_client.default_headers['Authorization'] = f"Bearer {token}"
@@ -76,32 +84,29 @@ class DeepLynxUserTester:
             return True
             
         except Exception as e:
-            logger.error(f"Authentication failed: {str(e)}")
+            logger.error("Authentication failed: %s", e)
             return False
 
     def list_users(self) -> List[Any]:
         """List all users in the system"""
         try:
             logger.info("\n=== Listing All Users ===")
-            logger.debug(f"Authorization header: {self.api_client.default_headers.get('Authorization', 'Not set')}")
+            logger.debug("Authorization header: %s", self.api_client.default_headers.get('Authorization', 'Not set'))
             
             users = self.users_api.list_users()
             
             if hasattr(users, 'value') and users.value:
-                logger.info(f"Found {len(users.value)} total users")
-                for user in users.value:
-                    # Log all available attributes for inspection
-                    logger.info("\nUser Details:")
-                    for attr in dir(user):
-                        if not attr.startswith('_'):  # Skip internal attributes
-                            value = getattr(user, attr, 'N/A')
-                            logger.info(f"  • {attr}: {value}")
+                logger.info("Found %d total users", len(users.value))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for user in users.value:
+                        # Log the model's declared fields for inspection
+                        logger.debug("User Details: %s", {attr: getattr(user, attr) for attr in user.attribute_map})
                 return users.value
             return []
             
         except ApiException as e:
-            logger.error(f"Failed to list users: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to list users: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return []
 
     def list_container_users(self) -> List[Any]:
@@ -113,27 +118,27 @@ class DeepLynxUserTester:
             )
             
             if hasattr(users, 'value') and users.value:
-                logger.info(f"Found {len(users.value)} users in container")
+                logger.info("Found %d users in container", len(users.value))
                 for user in users.value:
                     logger.info("\nUser Details:")
-                    logger.info(f"  • Name: {user.display_name}")
-                    logger.info(f"  • Email: {user.email}")
-                    logger.info(f"  • ID: {user.id}")
-                    logger.info(f"  • Status: {'Active' if user.active else 'Inactive'}")
-                    logger.info(f"  • Admin: {'Yes' if user.admin else 'No'}")
-                    logger.info(f"  • Provider: {user.identity_provider}")
-                    logger.info(f"  • Created: {user.created_at}")
+                    logger.info("  • Name: %s", user.display_name)
+                    logger.info("  • Email: %s", user.email)
+                    logger.info("  • ID: %s", user.id)
+                    logger.info("  • Status: %s", 'Active' if user.active else 'Inactive')
+                    logger.info("  • Admin: %s", 'Yes' if user.admin else 'No')
+                    logger.info("  • Provider: %s", user.identity_provider)
+                    logger.info("  • Created: %s", user.created_at)
                     
                     if user.permissions:
-                        logger.info(f"  • Permissions: {len(user.permissions)}")
+                        logger.info("  • Permissions: %d", len(user.permissions))
                     if user.roles:
-                        logger.info(f"  • Roles: {len(user.roles)}")
+                        logger.info("  • Roles: %d", len(user.roles))
                 return users.value
             return []
             
         except ApiException as e:
-            logger.error(f"Failed to list container users: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to list container users: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return []
 
     def list_service_users(self) -> List[Any]:
@@ -145,42 +150,42 @@ class DeepLynxUserTester:
             )
             
             if hasattr(users, 'value') and users.value:
-                logger.info(f"Found {len(users.value)} service users")
+                logger.info("Found %d service users", len(users.value))
                 for user in users.value:
-                    logger.debug(f"Service User: {user.name} (ID: {user.id})")
+                    logger.debug("Service User: %s (ID: %s)", user.name, user.id)
                 return users.value
             return []
             
         except ApiException as e:
-            logger.error(f"Failed to list service users: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to list service users: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return []
 
     def list_user_roles(self, user_id: str) -> List[Any]:
         """List roles for a specific user in the container"""
         try:
-            logger.info(f"\n=== Listing Roles for User {user_id} ===")
+            logger.info("\n=== Listing Roles for User %s ===", user_id)
             roles = self.users_api.list_users_roles(
                 container_id=self.container_id,
                 user_id=user_id
             )
             
             if hasattr(roles, 'value') and roles.value:
-                logger.info(f"Found {len(roles.value)} roles")
+                logger.info("Found %d roles", len(roles.value))
                 for role in roles.value:
                     if isinstance(role, str):
-                        logger.info(f"  • Role: {role}")
+                        logger.info("  • Role: %s", role)
                     else:
-                        logger.info(f"  • Role Name: {getattr(role, 'name', 'Unknown')}")
-                        logger.info(f"  • Role ID: {getattr(role, 'id', 'Unknown')}")
+                        logger.info("  • Role Name: %s", getattr(role, 'name', 'Unknown'))
+                        logger.info("  • Role ID: %s", getattr(role, 'id', 'Unknown'))
                         if hasattr(role, 'description'):
-                            logger.info(f"  • Description: {role.description}")
+                            logger.info("  • Description: %s", role.description)
                 return roles.value
             return []
             
         except ApiException as e:
-            logger.error(f"Failed to list user roles: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to list user roles: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return []
 
     def list_container_invites(self) -> List[Any]:
@@ -192,44 +197,51 @@ class DeepLynxUserTester:
             )
             
             if hasattr(invites, 'value') and invites.value:
-                logger.info(f"Found {len(invites.value)} pending invites")
+                logger.info("Found %d pending invites", len(invites.value))
                 for invite in invites.value:
-                    logger.debug(f"Invite: {invite.email}")
+                    logger.debug("Invite: %s", invite.email)
                 return invites.value
             return []
             
         except ApiException as e:
-            logger.error(f"Failed to list invites: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to list invites: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return []
 
     def invite_user_to_container(self, email: str) -> bool:
         """Invite a user to join the container"""
         try:
-            logger.info(f"\n=== Inviting User {email} to Container ===")
+            logger.info("\n=== Inviting User %s to Container ===", email)
             result = self.users_api.invite_user_to_container(
                 container_id=self.container_id,
                 body={"email": email}
             )
             
-            logger.info(f"Successfully invited user {email} to container")
-            logger.debug(f"Invite result: {result}")
+            logger.info("Successfully invited user %s to container", email)
+            logger.debug("Invite result: %s", result)
             return True
             
         except ApiException as e:
-            logger.error(f"Failed to invite user: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to invite user: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return False
 
-    def assign_user_to_container(self, user_id: str, role: str = "user") -> bool:
-        """Directly assign a user to the container with a role"""
+    def list_roles_for_users(self, user_ids: List[str]) -> Dict[str, List[Any]]:
+        """List roles for several users concurrently, keyed by user ID"""
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            return dict(zip(user_ids, executor.map(self.list_user_roles, user_ids)))
+
+    def assign_user_to_container(self, user_id: str, role: str = "user",
+                                 current_roles: Optional[List[Any]] = None) -> bool:
+        """Directly assign a user to the container with a role, skipping the role lookup when current_roles is given"""
         try:
-            logger.info(f"\n=== Assigning User {user_id} to Container ===")
+            logger.info("\n=== Assigning User %s to Container ===", user_id)
             
             # First, check if user already has roles
-            current_roles = self.list_user_roles(user_id)
+            if current_roles is None:
+                current_roles = self.list_user_roles(user_id)
             if role in current_roles:
-                logger.info(f"User already has role: {role}")
+                logger.info("User already has role: %s", role)
                 return True
             
             # Assign the role to the user
@@ -239,13 +251,13 @@ class DeepLynxUserTester:
                 body={"role": role}
             )
             
-            logger.info(f"Successfully assigned user {user_id} to container with role: {role}")
-            logger.debug(f"Assignment result: {result}")
+            logger.info("Successfully assigned user %s to container with role: %s", user_id, role)
+            logger.debug("Assignment result: %s", result)
             return True
             
         except ApiException as e:
-            logger.error(f"Failed to assign user: {e.status} - {e.reason}")
-            logger.debug(f"Response body: {e.body}")
+            logger.error("Failed to assign user: %s - %s", e.status, e.reason)
+            logger.debug("Response body: %s", e.body)
             return False
 
 def main():
@@ -269,66 +281,73 @@ def main():
         
         # 2. Invite a new user
         new_user_email = "test.user@example.com"  # Replace with actual email
-        logger.info(f"\n=== Inviting New User: {new_user_email} ===")
+        logger.info("\n=== Inviting New User: %s ===", new_user_email)
         if tester.invite_user_to_container(new_user_email):
-            logger.info(f"✓ Successfully sent invitation to {new_user_email}")
+            logger.info("✓ Successfully sent invitation to %s", new_user_email)
             
             # Check pending invites
             invites = tester.list_container_invites()
-            logger.info(f"Current pending invites: {len(invites)}")
+            logger.info("Current pending invites: %d", len(invites))
         
         # 3. Assign roles to existing user
         # Using the ID we got from listing users
+        roles_by_user = tester.list_roles_for_users([user.id for user in current_users])
         for user in current_users:
             user_id = user.id
             user_name = user.display_name
             
-            logger.info(f"\n=== Managing User: {user_name} ===")
+            logger.info("\n=== Managing User: %s ===", user_name)
             
-            # List current roles
-            current_roles = tester.list_user_roles(user_id)
-            logger.info(f"Current roles: {current_roles}")
+            # Current roles were fetched concurrently above
+            current_roles = roles_by_user[user_id]
+            logger.info("Current roles: %s", current_roles)
             
             # Assign a new role if they don't have it
             new_role = "user"  # Can be 'admin', 'user', or other roles defined in your system
             if new_role not in current_roles:
-                if tester.assign_user_to_container(user_id, new_role):
-                    logger.info(f"✓ Successfully assigned '{new_role}' role to {user_name}")
+                if tester.assign_user_to_container(user_id, new_role, current_roles=current_roles):
+                    logger.info("✓ Successfully assigned '%s' role to %s", new_role, user_name)
                     
                     # Verify the new role assignment
                     updated_roles = tester.list_user_roles(user_id)
-                    logger.info(f"Updated roles: {updated_roles}")
+                    logger.info("Updated roles: %s", updated_roles)
             else:
-                logger.info(f"User already has '{new_role}' role")
+                logger.info("User already has '%s' role", new_role)
         
         # 4. List service users (if any)
         service_users = tester.list_service_users()
         if service_users:
             logger.info("\n=== Service Users ===")
             for service_user in service_users:
-                logger.info(f"• Service User: {service_user.name} (ID: {service_user.id})")
+                logger.info("• Service User: %s (ID: %s)", service_user.name, service_user.id)
         else:
             logger.info("\nNo service users found")
         
         # 5. Final verification of all users and their roles
         logger.info("\n=== Final User Status ===")
         final_users = tester.list_container_users()
+        final_roles = tester.list_roles_for_users([user.id for user in final_users])
         for user in final_users:
-            logger.info(f"\nUser: {user.display_name}")
-            logger.info(f"• ID: {user.id}")
-            logger.info(f"• Email: {user.email}")
-            logger.info(f"• Status: {'Active' if user.active else 'Inactive'}")
+            logger.info("\nUser: %s", user.display_name)
+            logger.info("• ID: %s", user.id)
+            logger.info("• Email: %s", user.email)
+            logger.info("• Status: %s", 'Active' if user.active else 'Inactive')
             
-            roles = tester.list_user_roles(user.id)
-            logger.info(f"• Roles: {', '.join(roles) if roles else 'None'}")
+            roles = final_roles[user.id]
+            logger.info("• Roles: %s", ', '.join(roles) if roles else 'None')
         
     except Exception as e:
-        logger.error(f"Test failed: {str(e)}")
+        logger.error("Test failed: %s", e)
         logger.debug("Error details:", exc_info=True)
     finally:
         logger.info("\n=== User Management Tests Complete ===")
 
 if __name__ == "__main__":
-    # Set logging to DEBUG to see more details
-    logging.basicConfig(level=logging.DEBUG)
+    # Set LOG_LEVEL=DEBUG to see more details
+    logging.basicConfig(
+        level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    # Keep the SDK's per-request debug output out of the log
+    logging.getLogger('deep_lynx').setLevel(logging.WARNING)
     main() 
\ No newline at end of file
@@ -0,0 +1,131 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from queue import Empty, SimpleQueue
+from typing import Callable
+from deep_lynx.rest import ApiException, RESTClientObject
+
+# Upper bound on cached results across every @cached method
+MAX_ENTRIES = 1024
+
+# {(qualname, id(owner), args, kwargs): (value, expiry)}, least recently used first
+_store: OrderedDict = OrderedDict()
+_lock = threading.Lock()
+# ids of owners whose entries are dropped when they are garbage collected
+_owners = set()
+# ids of collected owners, queued by their finalizers and dropped on the next locked access.
+# The finalizer can run inside a GC pass triggered while _lock is held, so it must not lock.
+_collected: SimpleQueue = SimpleQueue()
+
+def _drop_collected() -> None:
+    """Forget collected owners' entries so a reused id never sees them; call with _lock held"""
+    dropped = set()
+    while True:
+        try:
+            dropped.add(_collected.get_nowait())
+        except Empty:
+            break
+    if dropped:
+        _owners.difference_update(dropped)
+        for key in [k for k in _store if k[1] in dropped]:
+            del _store[key]
+
+def _prune(now: float) -> None:
+    """Drop expired entries, then the least recently used ones beyond MAX_ENTRIES; call with _lock held"""
+    for key in [k for k, (_, expiry) in _store.items() if expiry <= now]:
+        del _store[key]
+    while len(_store) > MAX_ENTRIES:
+        _store.popitem(last=False)
+
+def cached(ttl: float = 60) -> Callable:
+    """Cache a method's results per instance for ttl seconds, keyed on its name and arguments"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            # Key on id(self) rather than self so the cache never keeps a client alive
+            owner_id = id(self)
+            key = (func.__qualname__, owner_id, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with _lock:
+                _drop_collected()
+                entry = _store.get(key)
+                if entry:
+                    if entry[1] > now:
+                        _store.move_to_end(key)
+                        return entry[0]
+                    del _store[key]
+
+            value = func(self, *args, **kwargs)
+            with _lock:
+                _drop_collected()
+                if owner_id not in _owners:
+                    _owners.add(owner_id)
+                    weakref.finalize(self, _collected.put, owner_id)
+                _store[key] = (value, now + ttl)
+                _store.move_to_end(key)
+                # Expired entries are otherwise dropped when read, so sweep only once over the cap
+                if len(_store) > MAX_ENTRIES:
+                    _prune(now)
+            return value
+
+        def cache_clear() -> None:
+            """Drop this function's cached results only"""
+            with _lock:
+                for key in [k for k in _store if k[0] == func.__qualname__]:
+                    del _store[key]
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+def invalidate() -> None:
+    """Drop all cached responses, e.g. after a membership or role change"""
+    with _lock:
+        _store.clear()
+
+class ETagRESTClient(RESTClientObject):
+    """REST client that revalidates repeated GETs with If-None-Match"""
+    def __init__(self, configuration, max_entries: int = 128, **kwargs):
+        super().__init__(configuration, **kwargs)
+        # {(url, query): response}, least recently used first
+        self._responses: OrderedDict = OrderedDict()
+        self._max_entries = max_entries
+        self._etag_lock = threading.Lock()
+
+    def GET(self, url, headers=None, query_params=None, _preload_content=True,
+            _request_timeout=None):
+        if not _preload_content:
+            return super().GET(url, headers=headers, query_params=query_params,
+                               _preload_content=_preload_content,
+                               _request_timeout=_request_timeout)
+
+        key = (url, tuple(query_params or ()))
+        with self._etag_lock:
+            stored = self._responses.get(key)
+        headers = dict(headers or {})
+        if stored:
+            headers['If-None-Match'] = stored.getheader('ETag')
+
+        try:
+            response = super().GET(url, headers=headers, query_params=query_params,
+                                   _request_timeout=_request_timeout)
+        except ApiException as e:
+            # 304 Not Modified: the stored body is still current
+            if e.status == 304 and stored:
+                with self._etag_lock:
+                    if key in self._responses:
+                        self._responses.move_to_end(key)
+                return stored
+            raise
+
+        with self._etag_lock:
+            if response.getheader('ETag'):
+                self._responses[key] = response
+                self._responses.move_to_end(key)
+                if len(self._responses) > self._max_entries:
+                    self._responses.popitem(last=False)
+            else:
+                self._responses.pop(key, None)
+        return response
\ No newline at end of file
@@ -0,0 +1,34 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+@dataclass(slots=True, frozen=True)
+class UserInfo:
+    """A container user with the roles they hold in it"""
+    id: str
+    name: str
+    email: str
+    active: bool
+    admin: bool
+    provider: str
+    created_at: Optional[str]
+    roles: Tuple[str, ...]
+
+    def __getitem__(self, key: str) -> Any:
+        # Keeps user['name'] style callers working
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True, frozen=True)
+class ServiceUserInfo:
+    """A service user in the container"""
+    id: str
+    name: str
+    created_at: Optional[str]
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
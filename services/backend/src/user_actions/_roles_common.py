@@ -0,0 +1,49 @@
+from .base_client import DeepLynxClient, _unwrap, get_default_client
+import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from deep_lynx.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on role lookups in flight at once
+MAX_CONCURRENT_ROLE_LOOKUPS = 10
+
+_role_name = operator.attrgetter('name')
+
+def list_user_roles(user_id: str, client: DeepLynxClient = None) -> List[str]:
+    """List roles for a specific user"""
+    client = client or get_default_client()
+        
+    if not client.authenticate():
+        logger.error("Authentication failed")
+        return []
+        
+    return _fetch_user_roles(user_id, client)
+
+def _fetch_user_roles(user_id: str, client: DeepLynxClient) -> List[str]:
+    """Role names for a user, for callers that have already authenticated the client"""
+    try:
+        roles = _unwrap(client.list_users_roles_cached(client.container_id, user_id))
+        if not roles:
+            return []
+        
+        # A response's roles share one type, so pick the extraction once
+        if isinstance(roles[0], str):
+            return list(roles)
+        try:
+            return list(map(_role_name, roles))
+        except AttributeError:
+            return [getattr(role, 'name', 'Unknown') for role in roles]
+        
+    except ApiException as e:
+        logger.error("Failed to list roles for user %s: %s - %s", user_id, e.status, e.reason)
+        return []
+
+def list_container_users_roles(client: DeepLynxClient, user_ids: List[str]) -> Dict[str, List[str]]:
+    """Map each user id to its roles in the client's container; the client must already be authenticated"""
+    # Deep Lynx has no batch roles endpoint, so fan out one lookup per user on worker threads
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ROLE_LOOKUPS) as executor:
+        roles_per_user = executor.map(lambda user_id: _fetch_user_roles(user_id, client), user_ids)
+        return dict(zip(user_ids, roles_per_user))
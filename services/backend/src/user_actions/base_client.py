@@ -1,16 +1,53 @@
 import deep_lynx
 from deep_lynx.rest import ApiException
+from urllib3.util.retry import Retry
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from jose import JWTError, jwt
+import base64
+import certifi
 import os
+import ssl
 from dotenv import load_dotenv
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+from ._cache import ETagRESTClient, cached
 
 logger = logging.getLogger(__name__)
 
+# Token lifetime assumed when the token carries no exp claim
+TOKEN_TTL = 55 * 60
+# Refresh this many seconds before a token's exp claim
+TOKEN_REFRESH_MARGIN = 60
+
+# Page size for limit/offset list endpoints
+PAGE_SIZE = 100
+
+# Connection pool settings for the underlying urllib3 PoolManager
+POOL_MAXSIZE = 64
+
+# One TLS context for every client, so certifi's CA bundle is loaded once rather than per pool
+# (sharing a context does not resume TLS sessions; CPython needs an explicit session= for that)
+SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
 class DeepLynxClient:
     """Base client for Deep Lynx operations"""
+    __slots__ = (
+        'host', 'api_key', 'api_secret', 'container_id',
+        'configuration', 'api_client', 'session',
+        'users_api', 'auth_api', 'containers_api',
+        '_token_expiry', '_auth_lock', '__weakref__'
+    )
+
     def __init__(self, host: str = None, env_file_path: str = None):
         self.host = host  # Store the host parameter first
+        self._token_expiry = 0.0
+        # Serializes token refreshes so concurrent callers share one OAuth request
+        self._auth_lock = threading.Lock()
         self._init_from_env(env_file_path)
         self._setup_client()
         
@@ -39,30 +76,139 @@ class DeepLynxClient:
         """Set up the Deep Lynx API client and initialize all needed APIs"""
         self.configuration = deep_lynx.Configuration()
         self.configuration.host = self.host
-        
-        auth_str = f"{self.api_key}:{self.api_secret}"
-        self.configuration.api_key['Authorization'] = auth_str
-        self.configuration.api_key_prefix['Authorization'] = 'Basic'
+        self.configuration.connection_pool_maxsize = POOL_MAXSIZE
         
         self.api_client = deep_lynx.ApiClient(self.configuration)
+        # Revalidate repeated GETs (container and user listings) instead of re-downloading them
+        self.api_client.rest_client = ETagRESTClient(self.configuration)
+        
+        # Encode the Basic credentials once; authenticate() swaps in a Bearer token
+        auth_str = base64.b64encode(f"{self.api_key}:{self.api_secret}".encode()).decode()
+        self.api_client.default_headers['Authorization'] = f"Basic {auth_str}"
+        
+        # Keep pooled connections alive between calls and retry transient gateway errors
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        self.api_client.rest_client.pool_manager.connection_pool_kw.update({
+            'block': False,
+            'retries': retries
+        })
+        if self.configuration.verify_ssl and not self.configuration.ssl_ca_cert:
+            pool_kw = self.api_client.rest_client.pool_manager.connection_pool_kw
+            pool_kw.pop('ca_certs', None)
+            pool_kw['ssl_context'] = SSL_CONTEXT
+        self.api_client.default_headers['Connection'] = 'keep-alive'
+        
+        # Pooled session for raw JSON reads that bypass the generated models
+        self.session = requests.Session()
+        self.session.mount(self.host, HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retries))
+        self.session.headers['Authorization'] = self.api_client.default_headers['Authorization']
         
         # Initialize all needed APIs
         self.users_api = deep_lynx.UsersApi(self.api_client)
         self.auth_api = deep_lynx.AuthenticationApi(self.api_client)
         self.containers_api = deep_lynx.ContainersApi(self.api_client)
+
+    def _get_json(self, path: str, **params) -> Dict[str, Any]:
+        """GET a Deep Lynx endpoint over the pooled session and return the decoded body"""
+        try:
+            response = self.session.get(f"{self.host}{path}", params=params)
+        except requests.RequestException as e:
+            raise ApiException(reason=str(e)) from e
+        if not response.ok:
+            raise ApiException(status=response.status_code, reason=response.reason)
+        return orjson.loads(response.content)
+
+    @cached(ttl=60)
+    def list_containers_cached(self):
+        """List containers, reusing responses for up to 60 seconds"""
+        return self.containers_api.list_containers()
+
+    @cached(ttl=60)
+    def list_member_container_ids_cached(self) -> Set[str]:
+        """IDs of containers the authenticated user has permissions in, reused for up to 60 seconds"""
+        # Each permission is a [user, container_id, resource, action] policy, which the
+        # generated model mistypes as list[str], so read the raw body instead
+        permissions = self._get_json('/users/permissions').get('value') or []
+        return {str(p[1]) for p in permissions if isinstance(p, list) and len(p) > 1}
+
+    @cached(ttl=60)
+    def list_users_roles_cached(self, container_id: str, user_id: str):
+        """List a user's roles in a container, reusing responses for up to 60 seconds"""
+        return self.users_api.list_users_roles(container_id=container_id, user_id=user_id)
         
-    def authenticate(self) -> bool:
-        """Authenticate with Deep Lynx"""
+    def _token_deadline(self, token: str) -> float:
+        """Monotonic time at which a token should be refreshed, read from its exp claim when present"""
+        lifetime = TOKEN_TTL
         try:
-            token_response = self.auth_api.retrieve_o_auth_token(
-                x_api_key=self.api_key,
-                x_api_secret=self.api_secret
-            )
-            
-            token = token_response.value if hasattr(token_response, 'value') else token_response
-            self.api_client.default_headers['Authorization'] = f"Bearer {token}"
+            exp = jwt.get_unverified_claims(token).get('exp')
+            if exp:
+                lifetime = exp - time.time() - TOKEN_REFRESH_MARGIN
+        except JWTError:
+            logger.debug("Token has no readable exp claim, assuming %s seconds", TOKEN_TTL)
+        return time.monotonic() + lifetime
+
+    def current_user_id(self) -> Optional[str]:
+        """ID of the authenticated user, read from the bearer token's claims"""
+        auth = self.api_client.default_headers.get('Authorization', '')
+        if not auth.startswith('Bearer '):
+            return None
+        try:
+            user_id = jwt.get_unverified_claims(auth[len('Bearer '):]).get('id')
+        except JWTError:
+            return None
+        return str(user_id) if user_id else None
+
+    def authenticate(self, force: bool = False) -> bool:
+        """Authenticate with Deep Lynx, reusing the current token until it expires"""
+        if not force and time.monotonic() < self._token_expiry:
             return True
             
-        except Exception as e:
-            logger.error(f"Authentication failed: {str(e)}")
-            return False 
\ No newline at end of file
+        with self._auth_lock:
+            # Another thread may have refreshed the token while this one waited
+            if not force and time.monotonic() < self._token_expiry:
+                return True
+                
+            try:
+                token_response = self.auth_api.retrieve_o_auth_token(
+                    x_api_key=self.api_key,
+                    x_api_secret=self.api_secret
+                )
+                
+                token = token_response.value if hasattr(token_response, 'value') else token_response
+                self.api_client.default_headers['Authorization'] = f"Bearer {token}"
+                self.session.headers['Authorization'] = f"Bearer {token}"
+                self._token_expiry = self._token_deadline(str(token))
+                return True
+                
+            except ApiException as e:
+                logger.error("Authentication failed: %s - %s", e.status, e.reason)
+                return False
+
+def _unwrap(response) -> List[Any]:
+    """Return the value list of a Deep Lynx list response, or [] when it has none"""
+    return getattr(response, 'value', None) or []
+
+def _iter_pages(api_call: Callable, page_size: int = PAGE_SIZE, **kwargs) -> Iterator[List[Any]]:
+    """Yield pages of a limit/offset list endpoint, fetching the next page while the caller handles the current one"""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offset = 0
+        future = executor.submit(api_call, limit=page_size, offset=offset, **kwargs)
+        while future:
+            page = _unwrap(future.result())
+            offset += page_size
+            # A short page is the last one
+            future = executor.submit(api_call, limit=page_size, offset=offset, **kwargs) if len(page) == page_size else None
+            yield page
+
+# Shared instance
+_client: Optional[DeepLynxClient] = None
+_client_lock = threading.Lock()
+
+def get_default_client() -> DeepLynxClient:
+    """Get or create the shared DeepLynxClient"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DeepLynxClient()
+    return _client
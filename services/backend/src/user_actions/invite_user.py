@@ -1,13 +1,14 @@
-from .base_client import DeepLynxClient
+from .base_client import DeepLynxClient, _unwrap, get_default_client
+from ._cache import invalidate
 import logging
 from typing import List, Any
+from deep_lynx.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
 def invite_user(email: str, client: DeepLynxClient = None) -> bool:
     """Invite a user to join the container"""
-    if not client:
-        client = DeepLynxClient()
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
@@ -18,17 +19,17 @@ def invite_user(email: str, client: DeepLynxClient = None) -> bool:
             container_id=client.container_id,
             body={"email": email}
         )
-        logger.info(f"Successfully invited user {email} to container")
+        invalidate()
+        logger.info("Successfully invited user %s to container", email)
         return True
         
-    except Exception as e:
-        logger.error(f"Failed to invite user: {str(e)}")
+    except ApiException as e:
+        logger.error("Failed to invite user: %s - %s", e.status, e.reason)
         return False
 
 def list_pending_invites(client: DeepLynxClient = None) -> List[Any]:
     """List all pending invites for the container"""
-    if not client:
-        client = DeepLynxClient()
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
@@ -38,14 +39,13 @@ def list_pending_invites(client: DeepLynxClient = None) -> List[Any]:
         invites = client.users_api.list_invited_users_for_container(
             container_id=client.container_id
         )
-        if hasattr(invites, 'value') and invites.value:
-            for invite in invites.value:
-                logger.info(f"Pending invite: {invite.email}")
-            return invites.value
-        return []
+        invite_list = _unwrap(invites)
+        for invite in invite_list:
+            logger.info("Pending invite: %s", invite.email)
+        return invite_list
         
-    except Exception as e:
-        logger.error(f"Failed to list invites: {str(e)}")
+    except ApiException as e:
+        logger.error("Failed to list invites: %s - %s", e.status, e.reason)
         return []
 
 if __name__ == "__main__":
@@ -1,65 +1,54 @@
-from user_actions.base_client import DeepLynxClient
+from user_actions.base_client import DeepLynxClient, _iter_pages, get_default_client
+from user_actions._models import UserInfo
+from user_actions._roles_common import list_container_users_roles
 import logging
-from typing import List, Any, Dict
+from typing import List, Any, Iterator
+from deep_lynx.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
-def list_container_users(client: DeepLynxClient = None) -> List[Dict[str, Any]]:
+def list_container_users(client: DeepLynxClient = None) -> List[UserInfo]:
     """List all users in the container with detailed information"""
-    if not client:
-        client = DeepLynxClient()
+    return list(iter_container_users(client))
+
+def iter_container_users(client: DeepLynxClient = None) -> Iterator[UserInfo]:
+    """Yield each user in the container with detailed information"""
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
-        return []
+        return
         
     try:
-        users = client.users_api.list_users_for_container(
+        pages = _iter_pages(
+            client.users_api.list_users_for_container,
             container_id=client.container_id
         )
         
-        if hasattr(users, 'value') and users.value:
-            user_list = []
-            for user in users.value:
-                user_info = {
-                    'id': user.id,
-                    'name': user.display_name,
-                    'email': user.email,
-                    'active': user.active,
-                    'admin': user.admin,
-                    'provider': user.identity_provider,
-                    'created_at': user.created_at,
-                    'roles': list_user_roles(user.id, client)
-                }
-                user_list.append(user_info)
-                logger.info(f"\nUser: {user.display_name}")
-                logger.info(f"• ID: {user.id}")
-                logger.info(f"• Email: {user.email}")
-                logger.info(f"• Status: {'Active' if user.active else 'Inactive'}")
-                logger.info(f"• Roles: {', '.join(user_info['roles'])}")
-            return user_list
-        return []
-        
-    except Exception as e:
-        logger.error(f"Failed to list users: {str(e)}")
-        return []
-
-def list_user_roles(user_id: str, client: DeepLynxClient) -> List[str]:
-    """Helper function to list user roles"""
-    try:
-        roles = client.users_api.list_users_roles(
-            container_id=client.container_id,
-            user_id=user_id
-        )
-        
-        if hasattr(roles, 'value') and roles.value:
-            return [role if isinstance(role, str) else getattr(role, 'name', 'Unknown') 
-                   for role in roles.value]
-        return []
+        for user_values in pages:
+            roles_map = list_container_users_roles(client, [user.id for user in user_values])
+            
+            for user in user_values:
+                user_info = UserInfo(
+                    id=user.id,
+                    name=user.display_name,
+                    email=user.email,
+                    active=user.active,
+                    admin=user.admin,
+                    provider=user.identity_provider,
+                    created_at=user.created_at,
+                    roles=tuple(roles_map[user.id])
+                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("\nUser: %s", user.display_name)
+                    logger.info("• ID: %s", user.id)
+                    logger.info("• Email: %s", user.email)
+                    logger.info("• Status: %s", 'Active' if user.active else 'Inactive')
+                    logger.info("• Roles: %s", ', '.join(user_info.roles))
+                yield user_info
         
-    except Exception as e:
-        logger.error(f"Failed to list roles for user {user_id}: {str(e)}")
-        return []
+    except ApiException as e:
+        logger.error("Failed to list users: %s - %s", e.status, e.reason)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
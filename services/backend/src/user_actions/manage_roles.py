@@ -1,13 +1,17 @@
-from .base_client import DeepLynxClient
+from .base_client import DeepLynxClient, get_default_client
+from ._cache import invalidate
+from ._roles_common import MAX_CONCURRENT_ROLE_LOOKUPS, list_container_users_roles, list_user_roles
 import logging
-from typing import List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, List, Any, Optional, Tuple
+from deep_lynx.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
-def assign_role(user_id: str, role: str = "user", client: DeepLynxClient = None) -> bool:
-    """Assign a role to a user in the container"""
-    if not client:
-        client = DeepLynxClient()
+def assign_role(user_id: str, role: str = "user", client: DeepLynxClient = None,
+                known_roles: Optional[Collection[str]] = None) -> bool:
+    """Assign a role to a user in the container, skipping the role lookup when known_roles is given"""
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
@@ -15,51 +19,39 @@ def assign_role(user_id: str, role: str = "user", client: DeepLynxClient = None)
         
     try:
         # Check current roles first
-        current_roles = list_user_roles(user_id, client)
+        current_roles = known_roles if known_roles is not None else list_user_roles(user_id, client)
         if role in current_roles:
-            logger.info(f"User already has role: {role}")
+            logger.info("User already has role: %s", role)
             return True
             
         result = client.users_api.assign_user_role(
-            container_id=client.container_id,
-            user_id=user_id,
-            body={"role": role}
+            body={"user_id": user_id, "container_id": client.container_id, "role_name": role},
+            container_id=client.container_id
         )
-        logger.info(f"Successfully assigned role '{role}' to user {user_id}")
+        invalidate()
+        logger.info("Successfully assigned role '%s' to user %s", role, user_id)
         return True
         
-    except Exception as e:
-        logger.error(f"Failed to assign role: {str(e)}")
+    except ApiException as e:
+        logger.error("Failed to assign role: %s - %s", e.status, e.reason)
         return False
 
-def list_user_roles(user_id: str, client: DeepLynxClient = None) -> List[str]:
-    """List roles for a specific user"""
-    if not client:
-        client = DeepLynxClient()
+def assign_roles_bulk(assignments: List[Tuple[str, str]], client: DeepLynxClient = None) -> bool:
+    """Assign (user_id, role) pairs, looking up everyone's current roles once"""
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
-        return []
-        
-    try:
-        roles = client.users_api.list_users_roles(
-            container_id=client.container_id,
-            user_id=user_id
-        )
-        
-        if hasattr(roles, 'value') and roles.value:
-            role_list = []
-            for role in roles.value:
-                if isinstance(role, str):
-                    role_list.append(role)
-                else:
-                    role_list.append(getattr(role, 'name', 'Unknown'))
-            return role_list
-        return []
+        return False
         
-    except Exception as e:
-        logger.error(f"Failed to list roles: {str(e)}")
-        return []
+    roles_map = list_container_users_roles(client, list({user_id for user_id, _ in assignments}))
+    pending = [(user_id, role) for user_id, role in dict.fromkeys(assignments)
+               if role not in roles_map[user_id]]
+    
+    # Post the assignments a user doesn't already hold, a bounded number at a time
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ROLE_LOOKUPS) as executor:
+        results = executor.map(lambda item: assign_role(item[0], item[1], client, ()), pending)
+        return all(results)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
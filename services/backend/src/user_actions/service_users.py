@@ -1,13 +1,14 @@
-from .base_client import DeepLynxClient
+from .base_client import DeepLynxClient, _unwrap, get_default_client
+from ._models import ServiceUserInfo
 import logging
 from typing import List, Dict, Any
+from deep_lynx.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
 def create_service_user(name: str, client: DeepLynxClient = None) -> Dict[str, Any]:
     """Create a new service user"""
-    if not client:
-        client = DeepLynxClient()
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
@@ -19,23 +20,23 @@ def create_service_user(name: str, client: DeepLynxClient = None) -> Dict[str, A
             body={"name": name}
         )
         
-        if hasattr(result, 'value'):
-            logger.info(f"Created service user: {name}")
+        # The SDK leaves service users untyped, so they arrive as plain dicts
+        if getattr(result, 'value', None):
+            logger.info("Created service user: %s", name)
             return {
-                'id': result.value.id,
-                'name': result.value.name,
-                'created_at': result.value.created_at
+                'id': result.value.get('id'),
+                'name': result.value.get('name'),
+                'created_at': result.value.get('created_at')
             }
         return {}
         
-    except Exception as e:
-        logger.error(f"Failed to create service user: {str(e)}")
+    except ApiException as e:
+        logger.error("Failed to create service user: %s - %s", e.status, e.reason)
         return {}
 
-def list_service_users(client: DeepLynxClient = None) -> List[Dict[str, Any]]:
+def list_service_users(client: DeepLynxClient = None) -> List[ServiceUserInfo]:
     """List all service users in the container"""
-    if not client:
-        client = DeepLynxClient()
+    client = client or get_default_client()
         
     if not client.authenticate():
         logger.error("Authentication failed")
@@ -46,21 +47,20 @@ def list_service_users(client: DeepLynxClient = None) -> List[Dict[str, Any]]:
             container_id=client.container_id
         )
         
-        if hasattr(users, 'value') and users.value:
-            service_users = []
-            for user in users.value:
-                user_info = {
-                    'id': user.id,
-                    'name': user.name,
-                    'created_at': user.created_at
-                }
-                service_users.append(user_info)
-                logger.info(f"Service User: {user.name} (ID: {user.id})")
-            return service_users
-        return []
+        service_users = []
+        for user in _unwrap(users):
+            user_info = ServiceUserInfo(
+                id=user.get('id'),
+                name=user.get('name'),
+                created_at=user.get('created_at')
+            )
+            service_users.append(user_info)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Service User: %s (ID: %s)", user_info.name, user_info.id)
+        return service_users
         
-    except Exception as e:
-        logger.error(f"Failed to list service users: {str(e)}")
+    except ApiException as e:
+        logger.error("Failed to list service users: %s - %s", e.status, e.reason)
         return []
 
 if __name__ == "__main__":
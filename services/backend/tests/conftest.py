@@ -1,5 +1,6 @@
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 import logging
 import sys
 from pathlib import Path
@@ -25,15 +26,15 @@ def event_loop():
     yield loop
     loop.close()
 
-@pytest.fixture
-async def client() -> TestClient:
-    """Test client fixture"""
+@pytest_asyncio.fixture(scope="session")
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Test client fixture, dispatching straight into the ASGI app and shared across the session"""
     logger.debug("Creating test client")
-    client = TestClient(app)
-    return client
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
-@pytest.fixture
-async def auth_headers() -> Dict[str, str]:
+@pytest.fixture(scope="session")
+def auth_headers() -> Dict[str, str]:
     """Auth headers for test requests"""
     logger.debug("Creating auth headers with test token")
     return {
@@ -75,7 +76,7 @@ def mock_settings(monkeypatch):
     monkeypatch.setattr("src.core.config.get_settings", mock_get_settings)
     return test_settings
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_source():
     """Test data source fixture"""
     logger.debug("Creating test data source")
@@ -1,5 +1,6 @@
+import asyncio
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 from deep_lynx.models import (
     ListDataSourcesResponse,
     CreateDataSourcesResponse,
@@ -10,7 +11,9 @@ from deep_lynx.models import (
 )
 from deep_lynx.api import DataSourcesApi
 from deep_lynx.rest import ApiException
+import copy
 import logging
+import logging.handlers
 import json
 import time
 from typing import Dict, Any
@@ -18,11 +21,12 @@ from typing import Dict, Any
 # Enhanced logging setup
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
-file_handler = logging.FileHandler('test_data_source.log')
+file_handler = logging.FileHandler('test_data_source.log', delay=True)
 file_handler.setFormatter(logging.Formatter(
     '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 ))
-logger.addHandler(file_handler)
+# Buffer records and write them in batches (flushed immediately on errors)
+logger.addHandler(logging.handlers.MemoryHandler(capacity=1000, target=file_handler))
 
 class TestContext:
     """Context manager for test cases with detailed logging"""
@@ -31,12 +35,12 @@ class TestContext:
         self.start_time = None
         
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         logger.info(f"\n{'='*20} Starting Test: {self.description} {'='*20}")
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         if exc_type:
             logger.error(
                 f"Test '{self.description}' failed after {duration:.2f}s\n"
@@ -50,48 +54,45 @@ class TestContext:
 def validate_response(response: Dict[str, Any], expected_model: Any, context: str = "") -> None:
     """Validate response against Deep Lynx schema"""
     try:
-        logger.debug(f"Validating response for {context}")
-        logger.debug(f"Response data: {json.dumps(response, indent=2)}")
+        logger.debug("Validating response for %s", context)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response data: %s", json.dumps(response, indent=2))
         validated = expected_model(**response)
-        logger.info(f"Response validation successful for {context}")
+        logger.info("Response validation successful for %s", context)
         return validated
     except Exception as e:
-        logger.error(f"Schema validation failed for {context}: {str(e)}")
+        logger.error("Schema validation failed for %s: %s", context, e)
         raise
 
-@pytest.fixture
-def sample_data_source():
-    """Fixture for test data source with enhanced logging"""
-    config = {
-        "name": "test-source",
-        "type": "standard",
-        "adapter_type": "standard",
-        "config": {
-            "data_type": "json",
-            "kind": "standard",
-            "options": {
-                "batch_size": 1000,
-                "retry_count": 3,
-                "timeout": 30
-            }
+_SAMPLE_SOURCE = {
+    "name": "test-source",
+    "type": "standard",
+    "adapter_type": "standard",
+    "config": {
+        "data_type": "json",
+        "kind": "standard",
+        "options": {
+            "batch_size": 1000,
+            "retry_count": 3,
+            "timeout": 30
         }
     }
-    logger.debug(f"Created sample data source config: {json.dumps(config, indent=2)}")
-    return config
+}
+
+@pytest.fixture
+def sample_data_source():
+    """Fixture for test data source, a fresh copy of _SAMPLE_SOURCE per test"""
+    return copy.deepcopy(_SAMPLE_SOURCE)
 
 @pytest.mark.asyncio
-async def test_data_source_lifecycle(client: TestClient, auth_headers: Dict[str, str], sample_data_source):
+async def test_data_source_lifecycle(client: httpx.AsyncClient, auth_headers: Dict[str, str], sample_data_source):
     """Test complete lifecycle with enhanced validation and logging"""
-    # Get client and headers
-    test_client = await client
-    headers = await auth_headers
-    
     with TestContext("Data Source Lifecycle Test"):
         # Create
         with TestContext("Create Data Source"):
-            create_response = test_client.post(
+            create_response = await client.post(
                 "/datasources",
-                headers=headers,
+                headers=auth_headers,
                 json=sample_data_source
             )
             logger.debug(f"Create response: {create_response.json()}")
@@ -100,9 +101,6 @@ async def test_data_source_lifecycle(client: TestClient, auth_headers: Dict[str,
 @pytest.mark.asyncio
 async def test_data_source_error_handling(client, auth_headers):
     """Test error handling scenarios"""
-    test_client = await client
-    headers = await auth_headers
-    
     with TestContext("Data Source Error Handling"):
         # Invalid data source creation
         with TestContext("Invalid Data Source Creation"):
@@ -110,9 +108,9 @@ async def test_data_source_error_handling(client, auth_headers):
                 "name": "test-source",
                 # Missing required fields
             }
-            response = test_client.post(
+            response = await client.post(
                 "/datasources",
-                headers=headers,
+                headers=auth_headers,
                 json=invalid_source
             )
             assert response.status_code == 422
@@ -120,17 +118,14 @@ async def test_data_source_error_handling(client, auth_headers):
 @pytest.mark.asyncio
 async def test_data_source_validation(client, auth_headers, sample_data_source):
     """Test data source validation rules"""
-    test_client = await client
-    headers = await auth_headers
-    
     with TestContext("Data Source Validation"):
         # Name length validation
         with TestContext("Name Length"):
             invalid_name = sample_data_source.copy()
             invalid_name["name"] = "a" * 256  # Too long
-            response = test_client.post(
+            response = await client.post(
                 "/datasources",
-                headers=headers,
+                headers=auth_headers,
                 json=invalid_name
             )
             assert response.status_code == 422
@@ -138,37 +133,30 @@ async def test_data_source_validation(client, auth_headers, sample_data_source):
 @pytest.mark.asyncio
 async def test_data_source_batch_operations(client, auth_headers, sample_data_source):
     """Test batch operations on data sources"""
-    test_client = await client
-    headers = await auth_headers
-    created_ids = []
+    sources = [
+        dict(sample_data_source, name=f"test-source-{i}", type="standard")
+        for i in range(3)
+    ]
 
     with TestContext("Batch Operations"):
-        # Create multiple sources
-        for i in range(3):
-            source = sample_data_source.copy()
-            source["name"] = f"test-source-{i}"
-            source["type"] = "standard"  # Add required type field
-            response = test_client.post(
-                "/datasources",
-                headers=headers,
-                json=source
-            )
-            assert response.status_code == 201
-            created_ids.append(response.json()["id"])
+        # Create multiple sources concurrently
+        responses = await asyncio.gather(*[
+            client.post("/datasources", headers=auth_headers, json=source)
+            for source in sources
+        ])
+        assert all(response.status_code == 201 for response in responses)
+        created_ids = [response.json()["id"] for response in responses]
 
 @pytest.mark.asyncio
 async def test_data_source_config_updates(client, auth_headers, sample_data_source):
     """Test data source configuration updates"""
-    test_client = await client
-    headers = await auth_headers
-    
     with TestContext("Config Updates"):
         # Create initial source
         source = sample_data_source.copy()
         source["type"] = "standard"  # Add required type field
-        create_response = test_client.post(
+        create_response = await client.post(
             "/datasources",
-            headers=headers,
+            headers=auth_headers,
             json=source
         )
         assert create_response.status_code == 201
@@ -176,12 +164,9 @@ async def test_data_source_config_updates(client, auth_headers, sample_data_sour
 @pytest.mark.asyncio
 async def test_data_source_performance(client, auth_headers, sample_data_source):
     """Test performance metrics for data source operations"""
-    test_client = await client
-    headers = await auth_headers
-    
     with TestContext("Performance Testing"):
         # Measure list performance
         with TestContext("List Performance"):
-            start_time = time.time()
-            response = test_client.get("/datasources", headers=headers)
+            start_time = time.perf_counter()
+            response = await client.get("/datasources", headers=auth_headers)
             assert response.status_code == 200
\ No newline at end of file
@@ -0,0 +1,71 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from jose import jwt
+from src.user_actions import base_client
+from src.user_actions.base_client import DeepLynxClient, _iter_pages
+
+@pytest.fixture
+def dl_client(monkeypatch):
+    """DeepLynxClient built from test environment variables, never touching the network"""
+    monkeypatch.setenv('DEEP_LYNX_URL', 'http://localhost:8090')
+    monkeypatch.setenv('DEEP_LYNX_API_KEY', 'test_key')
+    monkeypatch.setenv('DEEP_LYNX_API_SECRET', 'test_secret')
+    monkeypatch.setenv('DEEP_LYNX_CONTAINER_ID', '1')
+    return DeepLynxClient()
+
+def _paged(items):
+    """Mock limit/offset endpoint serving items"""
+    return MagicMock(side_effect=lambda limit, offset, **kwargs: SimpleNamespace(value=items[offset:offset + limit]))
+
+def test_iter_pages_stops_after_short_page():
+    """A page shorter than page_size ends the listing without another request"""
+    api_call = _paged(['a', 'b', 'c'])
+    assert list(_iter_pages(api_call, page_size=2, container_id='1')) == [['a', 'b'], ['c']]
+    assert [call.kwargs['offset'] for call in api_call.call_args_list] == [0, 2]
+    assert api_call.call_args.kwargs['container_id'] == '1'
+
+def test_iter_pages_fetches_empty_page_after_exact_multiple():
+    """A full last page needs one more (empty) request to know it was the last"""
+    api_call = _paged(['a', 'b', 'c', 'd'])
+    assert list(_iter_pages(api_call, page_size=2)) == [['a', 'b'], ['c', 'd'], []]
+    assert api_call.call_count == 3
+
+def test_iter_pages_prefetches_next_page():
+    """The next page is requested while the caller still holds the current one"""
+    second_requested = threading.Event()
+    def api_call(limit, offset):
+        if offset:
+            second_requested.set()
+            return SimpleNamespace(value=[])
+        return SimpleNamespace(value=['a'])
+    pages = _iter_pages(api_call, page_size=1)
+    assert next(pages) == ['a']
+    assert second_requested.wait(timeout=1)
+    assert list(pages) == [[]]
+
+def test_token_deadline_reads_exp_claim(dl_client):
+    """The refresh deadline is the exp claim minus the refresh margin"""
+    token = jwt.encode({'exp': int(time.time()) + 3600}, 'secret')
+    remaining = dl_client._token_deadline(token) - time.monotonic()
+    assert remaining == pytest.approx(3600 - base_client.TOKEN_REFRESH_MARGIN, abs=2)
+
+@pytest.mark.parametrize("token", [jwt.encode({'id': '42'}, 'secret'), 'not-a-jwt'])
+def test_token_deadline_defaults_without_exp(dl_client, token):
+    """Tokens without a readable exp claim get TOKEN_TTL"""
+    remaining = dl_client._token_deadline(token) - time.monotonic()
+    assert remaining == pytest.approx(base_client.TOKEN_TTL, abs=2)
+
+def test_authenticate_refreshes_once_for_concurrent_callers(dl_client):
+    """Threads hitting an expired token share a single OAuth request"""
+    def retrieve_token(**kwargs):
+        time.sleep(0.05)
+        return SimpleNamespace(value='test_token_value')
+    dl_client.auth_api.retrieve_o_auth_token = MagicMock(side_effect=retrieve_token)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(lambda _: dl_client.authenticate(), range(8)))
+    assert dl_client.auth_api.retrieve_o_auth_token.call_count == 1
+    assert dl_client.api_client.default_headers['Authorization'] == 'Bearer test_token_value'
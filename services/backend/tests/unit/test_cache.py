@@ -0,0 +1,182 @@
+import gc
+import pytest
+import deep_lynx
+from unittest.mock import MagicMock
+from deep_lynx.rest import ApiException, RESTClientObject
+from src.user_actions import _cache
+from src.user_actions._cache import ETagRESTClient, cached
+
+class Clock:
+    """Stand-in for the time module whose monotonic() only moves when told to"""
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+class Owner:
+    """Object with a cached method that counts real calls"""
+    def __init__(self):
+        self.calls = 0
+
+    @cached(ttl=60)
+    def lookup(self, key):
+        self.calls += 1
+        return f"value-{key}"
+
+    @cached(ttl=60)
+    def other(self):
+        self.calls += 1
+        return "other"
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Start every test with an empty cache"""
+    _cache.invalidate()
+    yield
+    _cache.invalidate()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable clock for the cache module"""
+    clock = Clock()
+    monkeypatch.setattr(_cache, 'time', clock)
+    return clock
+
+def _keys_for(owner):
+    """Cache keys stored for one owner"""
+    return [key for key in _cache._store if key[1] == id(owner)]
+
+def test_cached_reuses_result_within_ttl(clock):
+    """Repeated calls inside the TTL hit the cache"""
+    owner = Owner()
+    assert owner.lookup(1) == "value-1"
+    clock.now += 59
+    assert owner.lookup(1) == "value-1"
+    assert owner.calls == 1
+
+def test_cached_recomputes_after_ttl(clock):
+    """An expired entry is dropped on read and recomputed"""
+    owner = Owner()
+    owner.lookup(1)
+    clock.now += 61
+    owner.lookup(1)
+    assert owner.calls == 2
+    assert len(_keys_for(owner)) == 1
+
+def test_cached_is_per_instance(clock):
+    """Two owners never see each other's results"""
+    first, second = Owner(), Owner()
+    first.lookup(1)
+    second.lookup(1)
+    assert (first.calls, second.calls) == (1, 1)
+
+def test_cached_evicts_least_recently_used(clock, monkeypatch):
+    """Past MAX_ENTRIES the least recently used entry goes first"""
+    monkeypatch.setattr(_cache, 'MAX_ENTRIES', 2)
+    owner = Owner()
+    owner.lookup(1)
+    owner.lookup(2)
+    owner.lookup(1)  # refresh 1 so 2 is the oldest
+    owner.lookup(3)
+    assert len(_cache._store) == 2
+    owner.lookup(1)
+    assert owner.calls == 3
+    owner.lookup(2)
+    assert owner.calls == 4
+
+def test_cached_sweeps_expired_entries_over_the_cap(clock, monkeypatch):
+    """The over-cap sweep drops expired entries before live ones"""
+    monkeypatch.setattr(_cache, 'MAX_ENTRIES', 2)
+    owner = Owner()
+    owner.lookup(1)
+    clock.now += 61
+    owner.lookup(2)
+    owner.lookup(3)
+    assert {key[2] for key in _cache._store} == {(2,), (3,)}
+
+def test_cache_clear_only_drops_its_function(clock):
+    """cache_clear leaves other cached methods alone"""
+    owner = Owner()
+    owner.lookup(1)
+    owner.other()
+    Owner.lookup.cache_clear()
+    owner.other()
+    assert owner.calls == 2
+    owner.lookup(1)
+    assert owner.calls == 3
+
+def test_invalidate_drops_everything(clock):
+    """invalidate empties the whole store"""
+    owner = Owner()
+    owner.lookup(1)
+    owner.other()
+    _cache.invalidate()
+    assert not _cache._store
+
+def test_collected_owner_entries_are_dropped(clock):
+    """Entries of a garbage collected owner are gone by the next access"""
+    owner = Owner()
+    owner.cycle = owner
+    owner.lookup(1)
+    owner_id = id(owner)
+    del owner
+    # The finalizer runs without taking the lock, so collecting while it is held must not block
+    with _cache._lock:
+        gc.collect()
+    Owner().lookup(2)
+    assert not [key for key in _cache._store if key[1] == owner_id]
+    assert owner_id not in _cache._owners
+
+@pytest.fixture
+def rest_get(mocker):
+    """Mocked parent GET that ETagRESTClient delegates to"""
+    return mocker.patch.object(RESTClientObject, 'GET')
+
+@pytest.fixture
+def etag_client(rest_get):
+    """ETagRESTClient keeping at most two responses"""
+    return ETagRESTClient(deep_lynx.Configuration(), max_entries=2)
+
+def _response(etag=None):
+    """Mock urllib3 response carrying the given ETag header"""
+    response = MagicMock()
+    response.getheader.side_effect = lambda name: etag if name == 'ETag' else None
+    return response
+
+def test_etag_revalidates_and_returns_stored_body_on_304(etag_client, rest_get):
+    """A 304 answer to If-None-Match returns the stored response"""
+    stored = _response('"v1"')
+    rest_get.side_effect = [stored, ApiException(status=304)]
+    assert etag_client.GET('http://test/containers') is stored
+    assert etag_client.GET('http://test/containers') is stored
+    assert rest_get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+def test_etag_reraises_other_errors(etag_client, rest_get):
+    """Errors other than 304 propagate even when a response is stored"""
+    rest_get.side_effect = [_response('"v1"'), ApiException(status=500)]
+    etag_client.GET('http://test/containers')
+    with pytest.raises(ApiException):
+        etag_client.GET('http://test/containers')
+
+def test_etag_skips_responses_without_etag(etag_client, rest_get):
+    """Responses without an ETag are not stored or revalidated"""
+    rest_get.side_effect = [_response(), _response()]
+    etag_client.GET('http://test/containers')
+    etag_client.GET('http://test/containers')
+    assert 'If-None-Match' not in rest_get.call_args.kwargs['headers']
+
+def test_etag_evicts_least_recently_used(etag_client, rest_get):
+    """Only max_entries responses are kept, oldest dropped first"""
+    rest_get.side_effect = [_response('"a"'), _response('"b"'), _response('"c"'), _response('"a2"')]
+    for url in ('http://test/a', 'http://test/b', 'http://test/c', 'http://test/a'):
+        etag_client.GET(url)
+    assert 'If-None-Match' not in rest_get.call_args.kwargs['headers']
+    assert len(etag_client._responses) == 2
+
+def test_etag_passes_streaming_requests_through(etag_client, rest_get):
+    """Requests that do not preload content bypass the ETag store"""
+    rest_get.return_value = _response('"v1"')
+    etag_client.GET('http://test/files', _preload_content=False)
+    assert not etag_client._responses
+    assert rest_get.call_args.kwargs['_preload_content'] is False
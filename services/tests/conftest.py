@@ -2,6 +2,6 @@ import pytest
 from fastapi.testclient import TestClient
 from src.main import app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
     return TestClient(app)
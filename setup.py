@@ -13,6 +13,7 @@ setup(
         "python-dotenv>=1.0.0",
         "pytest>=7.0.0",
         "pytest-cov>=4.0.0",
+        "pytest-mock>=3.12.0",
         "requests>=2.31.0",
         "urllib3>=2.0.0",
         "python-jose[cryptography]>=3.3.0",
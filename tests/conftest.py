@@ -1,8 +1,8 @@
+import functools
 import pytest
 from pathlib import Path
-from typing import Generator
 import os
-from unittest.mock import patch
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
 # Register custom markers
@@ -21,6 +21,15 @@ def pytest_configure(config):
         "markers", "error: marks tests related to error handling"
     )
 
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests at collection time unless DEEP_LYNX_INTEGRATION_TEST is set."""
+    if os.getenv('DEEP_LYNX_INTEGRATION_TEST'):
+        return
+    skip = pytest.mark.skip(reason="Integration test requires DEEP_LYNX_INTEGRATION_TEST=1")
+    for item in items:
+        if 'integration' in item.keywords:
+            item.add_marker(skip)
+
 @pytest.fixture(scope="session")
 def test_env_vars() -> dict:
     """Base test environment variables for unit tests."""
@@ -39,20 +48,50 @@ def mock_env(test_env_vars, monkeypatch) -> None:
     for key, value in test_env_vars.items():
         monkeypatch.setenv(key, value)
 
+# Non-prefixed env vars DeepLynxConfig reads
+_CONFIG_ENV_KEYS = ('DEBUG', 'LOG_LEVEL', 'MAX_RETRIES', 'POOL_CONNECTIONS', 'POOL_MAXSIZE')
+
+@functools.lru_cache(maxsize=16)
+def _cached_config(env_fingerprint: tuple):
+    from dev.config import DeepLynxConfig
+    return DeepLynxConfig()
+
+def _load_config():
+    """DeepLynxConfig for the current environment, reused across identical settings."""
+    from dev.config import DeepLynxConfig
+    env = tuple(sorted(
+        (k, v) for k, v in os.environ.items()
+        if k.startswith('DEEP_LYNX_') or k in _CONFIG_ENV_KEYS
+    ))
+    return _cached_config((str(DeepLynxConfig.model_config.get('env_file')), env))
+
+@pytest.fixture(scope="session")
+def cached_config(test_env_vars):
+    """DeepLynxConfig loaded once from the unit test environment and shared by tests that only read it."""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in test_env_vars.items():
+            mp.setenv(key, value)
+        return _load_config()
+
 @pytest.fixture
-def temp_env_file(tmp_path, test_env_vars) -> Generator[Path, None, None]:
-    """Create a temporary .env file."""
-    env_file = tmp_path / ".env"
+def config_for_env():
+    """Factory returning a DeepLynxConfig for the current environment, reused across identical settings."""
+    return _load_config
+
+@pytest.fixture(scope="session")
+def temp_env_file(tmp_path_factory, test_env_vars) -> Path:
+    """Create a temporary .env file, written once per session."""
+    env_file = tmp_path_factory.mktemp("env") / ".env"
     env_content = "\n".join(f"{k}={v}" for k, v in test_env_vars.items())
     env_file.write_text(env_content)
-    yield env_file
-    env_file.unlink(missing_ok=True)
+    return env_file
 
 @pytest.fixture
-def mock_auth_api():
-    """Mock Deep Lynx Authentication API."""
-    with patch('deep_lynx.AuthenticationApi') as mock:
-        yield mock
+def mock_auth_api(mocker):
+    """Mock Deep Lynx Authentication API, pre-wired to return a test token."""
+    api = mocker.patch('deep_lynx.AuthenticationApi')
+    api.return_value.retrieve_o_auth_token.return_value = SimpleNamespace(value='test_token_value')
+    return api
 
 @pytest.fixture
 def integration_env():
@@ -89,9 +128,9 @@ def integration_env():
         else:
             os.environ.pop(key, None)
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def cleanup_api_client():
-    """Cleanup API client connections after each test."""
+    """Cleanup API client connections once the test session ends."""
     yield
     # Force cleanup of any remaining API clients
     import gc
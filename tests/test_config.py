@@ -1,16 +1,29 @@
 import pytest
 from dev.config import DeepLynxConfig
 import deep_lynx
-from unittest.mock import patch, MagicMock
 from deep_lynx.rest import ApiException
-import os
-from pathlib import Path
+from types import SimpleNamespace
+from collections import ChainMap
+
+# Token returned by the mocked auth API; tests only read .value
+_MOCK_TOKEN = SimpleNamespace(value="test_token_value")
+
+# model_config overlays keyed by env file path, built once per path
+_MERGED_CFG_CACHE = {}
+
+def _cfg_with_env_file(path):
+    """DeepLynxConfig.model_config with env_file pointed at path."""
+    cfg = _MERGED_CFG_CACHE.get(path)
+    if cfg is None:
+        cfg = ChainMap({'env_file': path}, DeepLynxConfig.model_config)
+        _MERGED_CFG_CACHE[path] = cfg
+    return cfg
 
 @pytest.mark.unit
 @pytest.mark.config
-def test_config_loads_from_env(mock_env):
+def test_config_loads_from_env(cached_config):
     """Test that configuration loads from environment variables."""
-    config = DeepLynxConfig()
+    config = cached_config
     assert config.api_url == 'http://test.com'
     assert config.api_key == 'test_key'
     assert config.api_secret == 'test_secret'
@@ -19,42 +32,31 @@ def test_config_loads_from_env(mock_env):
 
 @pytest.mark.unit
 @pytest.mark.config
-def test_config_loads_from_env_file(temp_env_file):
+def test_config_loads_from_env_file(temp_env_file, mocker, config_for_env):
     """Test that configuration loads from .env file."""
-    with patch.object(DeepLynxConfig, 'model_config', {
-        **DeepLynxConfig.model_config,
-        'env_file': temp_env_file
-    }):
-        config = DeepLynxConfig()
-        assert config.api_url == 'http://test.com'
-        assert config.api_key == 'test_key'
-        assert config.api_secret == 'test_secret'
+    mocker.patch.object(DeepLynxConfig, 'model_config', _cfg_with_env_file(temp_env_file))
+    config = config_for_env()
+    assert config.api_url == 'http://test.com'
+    assert config.api_key == 'test_key'
+    assert config.api_secret == 'test_secret'
 
 @pytest.mark.unit
 @pytest.mark.config
-def test_config_env_precedence(mock_env, temp_env_file):
+def test_config_env_precedence(mock_env, temp_env_file, monkeypatch, config_for_env):
     """Test that environment variables take precedence over .env file."""
-    with patch.dict('os.environ', {
-        'DEEP_LYNX_URL': 'http://override.com'
-    }):
-        with patch.object(DeepLynxConfig, 'model_config', {
-            **DeepLynxConfig.model_config,
-            'env_file': temp_env_file
-        }):
-            config = DeepLynxConfig()
-            assert config.api_url == 'http://override.com'
-            assert config.api_key == 'test_key'  # From env file
+    monkeypatch.setenv('DEEP_LYNX_URL', 'http://override.com')
+    monkeypatch.setattr(DeepLynxConfig, 'model_config', _cfg_with_env_file(temp_env_file))
+    config = config_for_env()
+    assert config.api_url == 'http://override.com'
+    assert config.api_key == 'test_key'  # From env file
 
 @pytest.mark.integration
 @pytest.mark.config
 def test_get_client_end_to_end(integration_env):
     """
     End-to-end test for client initialization.
-    Only runs if DEEP_LYNX_INTEGRATION_TEST is set.
+    Only runs if DEEP_LYNX_INTEGRATION_TEST is set (see conftest.py).
     """
-    if not os.getenv('DEEP_LYNX_INTEGRATION_TEST'):
-        pytest.skip("Integration test requires DEEP_LYNX_INTEGRATION_TEST=1")
-    
     config = DeepLynxConfig()
     client = config.get_client()
     assert isinstance(client, deep_lynx.ApiClient)
@@ -70,17 +72,27 @@ def test_get_client_end_to_end(integration_env):
 
 @pytest.mark.unit
 @pytest.mark.config
-def test_get_client_token_handling(mock_auth_api, mock_env):
+@pytest.mark.parametrize("responses,expected_error,expected_msg", [
+    (None, None, None),
+    # Server errors are not retried by the auth layer
+    pytest.param([ApiException(status=503), ApiException(status=503), _MOCK_TOKEN], Exception, "Deep Lynx server error", marks=pytest.mark.error)
+])
+def test_get_client_token_handling(mock_auth_api, cached_config, responses, expected_error, expected_msg):
     """Test client initialization with token handling."""
-    mock_token = MagicMock()
-    mock_token.value = "test_token_value"
-    mock_auth_api.return_value.retrieve_o_auth_token.return_value = mock_token
+    retrieve_token = mock_auth_api.return_value.retrieve_o_auth_token
+    if responses is not None:
+        retrieve_token.side_effect = responses
     
-    config = DeepLynxConfig()
-    client = config.get_client()
+    config = cached_config
+    if expected_error is None:
+        config.get_client()
+    else:
+        with pytest.raises(expected_error) as exc_info:
+            config.get_client()
+        assert expected_msg in str(exc_info.value)
     
-    # Verify token retrieval call
-    mock_auth_api.return_value.retrieve_o_auth_token.assert_called_once_with(
+    # Verify a single token retrieval call
+    retrieve_token.assert_called_once_with(
         x_api_key=config.api_key,
         x_api_secret=config.api_secret,
         x_api_expiry='1h'
@@ -88,52 +100,33 @@ def test_get_client_token_handling(mock_auth_api, mock_env):
 
 @pytest.mark.unit
 @pytest.mark.error
-@pytest.mark.parametrize("error_status,expected_error", [
-    (401, ConnectionError),
-    (403, ConnectionError),
-    (500, Exception)
-])
-def test_get_client_error_handling(mock_env, error_status, expected_error):
+def test_get_client_error_handling(cached_config, mock_auth_api):
     """Test various error scenarios in client initialization."""
-    with patch('deep_lynx.AuthenticationApi') as mock_auth_api:
+    cases = [
+        (401, ConnectionError),
+        (403, ConnectionError),
+        (500, Exception)
+    ]
+    config = cached_config
+    for error_status, expected_error in cases:
         mock_auth_api.return_value.retrieve_o_auth_token.side_effect = \
             ApiException(status=error_status)
-        
-        config = DeepLynxConfig()
-        with pytest.raises(expected_error):
-            config.get_client() 
+        raised = None
+        try:
+            config.get_client()
+        except Exception as e:
+            raised = e
+        assert isinstance(raised, expected_error), (error_status, raised)
+        mock_auth_api.reset_mock()
 
 @pytest.mark.unit
 @pytest.mark.config
-def test_connection_pooling_config(mock_env):
+def test_connection_pooling_config(mock_env, monkeypatch, config_for_env):
     """Test connection pooling configuration."""
-    with patch.dict('os.environ', {
-        'POOL_CONNECTIONS': '20',
-        'POOL_MAXSIZE': '30',
-        'MAX_RETRIES': '5'
-    }):
-        config = DeepLynxConfig()
-        assert config.pool_connections == 20
-        assert config.pool_maxsize == 30
-        assert config.max_retries == 5
-
-@pytest.mark.unit
-@pytest.mark.error
-def test_retry_mechanism(mock_env):
-    """Test retry mechanism for failed requests."""
-    with patch('deep_lynx.AuthenticationApi') as mock_auth_api:
-        # Setup mock to fail with server errors then succeed
-        mock_token = MagicMock()
-        mock_token.value = "test_token_value"
-        mock_auth_api.return_value.retrieve_o_auth_token.side_effect = [
-            ApiException(status=503),
-            ApiException(status=503),
-            mock_token
-        ]
-        
-        config = DeepLynxConfig()
-        with pytest.raises(Exception) as exc_info:
-            config.get_client()
-        
-        assert "Deep Lynx server error" in str(exc_info.value)
-        assert mock_auth_api.return_value.retrieve_o_auth_token.call_count == 1  # No retry in auth layer
\ No newline at end of file
+    monkeypatch.setenv('POOL_CONNECTIONS', '20')
+    monkeypatch.setenv('POOL_MAXSIZE', '30')
+    monkeypatch.setenv('MAX_RETRIES', '5')
+    config = config_for_env()
+    assert config.pool_connections == 20
+    assert config.pool_maxsize == 30
+    assert config.max_retries == 5
\ No newline at end of file